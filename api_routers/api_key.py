@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import hashlib
 import os
@@ -121,7 +122,8 @@ async def reinitialize_models(session_id: str):
         )
 
         # Create new models with the API key
-        superego_model, inner_model = create_models(api_key)
+        # Model construction is blocking; keep it off the event loop
+        superego_model, inner_model = await asyncio.to_thread(create_models, api_key)
 
         # If models were created successfully, recreate the workflow
         if superego_model is not None and inner_model is not None:
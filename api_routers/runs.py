@@ -1,4 +1,6 @@
+import asyncio
 import json
+import time
 import traceback
 import uuid
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
@@ -38,6 +40,24 @@ router = APIRouter(prefix="/api/runs", tags=["runs"])
 router.graph_app_instance = None
 router.checkpointer_instance = None
 
+# Streamed text is coalesced per node into one "chunk" event once this much has built up
+CHUNK_FLUSH_CHARS = 256
+CHUNK_FLUSH_SECONDS = 0.05
+
+# Graph nodes whose name or tag marks which node an event belongs to
+GRAPH_NODE_NAMES = frozenset({"superego", "inner_agent", "tools"})
+
+
+async def _read_constitution_file(relative_path: Optional[str]) -> Optional[str]:
+    """Reads one constitution off the event loop; None if absent or unreadable."""
+    if not relative_path:
+        return None
+    try:
+        return await asyncio.to_thread(get_constitution_content, relative_path)
+    except Exception as e:
+        print(f"Error reading constitution from file {relative_path}: {e}")
+        return None
+
 
 # --- Helper Function for Standard Streaming ---
 # Moved from backend_server_async.py
@@ -65,25 +85,35 @@ async def stream_events(
     current_node_name: Optional[str] = None
     last_yielded_text: Dict[Tuple[Optional[str], Optional[str]], str] = {}
     final_checkpoint_id: Optional[str] = None
+    # Text not yet sent; every piece belongs to pending_node
+    pending_text: List[str] = []
+    pending_node: str = "unknown_node"
+    pending_chars = 0
+    pending_since = 0.0
+    next_event: Optional[asyncio.Future] = None  # In-flight read of the graph's event stream
+
+    def take_pending_chunk() -> Optional[SSEChunkData]:
+        nonlocal pending_chars
+        if not pending_text:
+            return None
+        payload = SSEChunkData(node=pending_node, content="".join(pending_text))
+        pending_text.clear()
+        pending_chars = 0
+        return payload
 
     try:
         # (content, title, level)
         processed_modules: List[Tuple[str, str, int]] = []
         missing_ids: List[str] = []
 
-        for module in run_config.configuredModules:
-            content = module.text
-            if (
-                module.relativePath
-            ):  # If relativePath is provided, try fetching from file
-                try:
-                    content = get_constitution_content(module.relativePath)
-                except Exception as e:
-                    print(
-                        f"Error reading constitution from file {module.relativePath}: {e}"
-                    )
-                    content = None  # Handle file reading errors gracefully
+        # Modules are independent, so their files are read concurrently
+        modules = run_config.configuredModules
+        file_contents = await asyncio.gather(
+            *(_read_constitution_file(module.relativePath) for module in modules)
+        )
 
+        for module, file_content in zip(modules, file_contents):
+            content = file_content if module.relativePath else module.text
             if content is None and module.text:
                 content = module.text  # Use provided text if available
 
@@ -155,7 +185,35 @@ async def stream_events(
             stream_input, config=config_payload, version="v1"
         )
 
-        async for event in stream:
+        stream_iter = stream.__aiter__()
+        while True:
+            # With text buffered, wait for the next event only until the text is
+            # CHUNK_FLUSH_SECONDS old, so it is flushed even if the model pauses. The
+            # read is kept in a task across the flush, as cancelling it would abort
+            # the stream; with nothing buffered the stream is awaited directly
+            if pending_text and next_event is None:
+                next_event = asyncio.ensure_future(stream_iter.__anext__())
+            if next_event is None:
+                try:
+                    event = await stream_iter.__anext__()
+                except StopAsyncIteration:
+                    break
+            else:
+                if pending_text:
+                    flush_in = pending_since + CHUNK_FLUSH_SECONDS - time.monotonic()
+                    await asyncio.wait({next_event}, timeout=max(flush_in, 0.0))
+                    if not next_event.done():
+                        yield await prepare_sse_event(
+                            "chunk", data_payload=take_pending_chunk(), thread_id=thread_id
+                        )
+                        continue
+                try:
+                    event = await next_event
+                except StopAsyncIteration:
+                    break
+                finally:
+                    next_event = None
+
             event_type = event.get("event")
             event_name = event.get("name")
             tags = event.get("tags", [])
@@ -165,25 +223,29 @@ async def stream_events(
             if run_id:
                 final_checkpoint_id = str(run_id)
 
-            potential_node_tags = [
-                tag for tag in tags if tag in ["superego", "inner_agent", "tools"]
-            ]
-            if event_name in ["superego", "inner_agent", "tools"]:
+            potential_node_tags = [tag for tag in tags if tag in GRAPH_NODE_NAMES]
+            if event_name in GRAPH_NODE_NAMES:
                 current_node_name = event_name
             elif potential_node_tags:
                 current_node_name = potential_node_tags[-1]
 
             yield_key = (current_node_name, set_id)
 
-            if event_type == "on_chat_model_stream" and isinstance(
-                event_data.get("chunk"), AIMessageChunk
-            ):
-                chunk: AIMessageChunk = event_data["chunk"]
+            # Classify the event once; model chunks carry both text and tool-call deltas
+            chunk = (
+                event_data.get("chunk")
+                if event_type == "on_chat_model_stream"
+                else None
+            )
+            if isinstance(chunk, AIMessageChunk):
+                # Read each chunk attribute once; this branch runs per streamed token
+                content = chunk.content
+                tool_chunks = chunk.tool_call_chunks
                 text_content = ""
-                if isinstance(chunk.content, str):
-                    text_content = chunk.content
-                elif isinstance(chunk.content, list):
-                    for item in chunk.content:
+                if isinstance(content, str):
+                    text_content = content
+                elif isinstance(content, list):
+                    for item in content:
                         if isinstance(item, dict):
                             if item.get("type") == "text":
                                 text_content += item.get("text", "")
@@ -196,24 +258,32 @@ async def stream_events(
                 if text_content:
                     last_text = last_yielded_text.get(yield_key, "")
                     if text_content != last_text:
-                        # Use helper for chunk event
-                        chunk_data_payload = SSEChunkData(
-                            node=current_node_name or "unknown_node",
-                            content=text_content,
-                        )
-                        yield await prepare_sse_event(
-                            "chunk",
-                            data_payload=chunk_data_payload,
-                            thread_id=thread_id,
-                        )
+                        text_node = current_node_name or "unknown_node"
+                        if pending_text and text_node != pending_node:
+                            yield await prepare_sse_event(
+                                "chunk",
+                                data_payload=take_pending_chunk(),
+                                thread_id=thread_id,
+                            )
+                        if not pending_text:
+                            pending_node = text_node
+                            pending_since = time.monotonic()
+                        pending_text.append(text_content)
+                        pending_chars += len(text_content)
+                        if pending_chars >= CHUNK_FLUSH_CHARS:
+                            yield await prepare_sse_event(
+                                "chunk",
+                                data_payload=take_pending_chunk(),
+                                thread_id=thread_id,
+                            )
                         last_yielded_text[yield_key] = text_content
 
-            if event_type == "on_chat_model_stream" and isinstance(
-                event_data.get("chunk"), AIMessageChunk
-            ):
-                chunk_for_tools: AIMessageChunk = event_data["chunk"]
-                tool_chunks = getattr(chunk_for_tools, "tool_call_chunks", [])
                 if tool_chunks:
+                    # Text streamed before the tool call must reach the client first
+                    if pending_text:
+                        yield await prepare_sse_event(
+                            "chunk", data_payload=take_pending_chunk(), thread_id=thread_id
+                        )
                     for tc_chunk in tool_chunks:
                         args_value = tc_chunk.get("args")
                         args_str: Optional[str] = None
@@ -240,15 +310,11 @@ async def stream_events(
                         )
 
             elif event_type == "on_tool_end":
-                tool_output = event_data.get("output")
-                try:
-                    output_str = (
-                        json.dumps(tool_output)
-                        if not isinstance(tool_output, str)
-                        else tool_output
+                if pending_text:
+                    yield await prepare_sse_event(
+                        "chunk", data_payload=take_pending_chunk(), thread_id=thread_id
                     )
-                except Exception:
-                    output_str = str(tool_output)
+                tool_output = event_data.get("output")
                 tool_func_name = event.get("name")
                 is_error = isinstance(tool_output, Exception)
                 tool_call_id = None
@@ -289,6 +355,11 @@ async def stream_events(
                     "tool_result", data_payload=sse_payload_data, thread_id=thread_id
                 )
 
+        if pending_text:
+            yield await prepare_sse_event(
+                "chunk", data_payload=take_pending_chunk(), thread_id=thread_id
+            )
+
         # --- Yield end event using helper ---
         end_data = SSEEndData(
             node=current_node_name or "graph",
@@ -303,7 +374,13 @@ async def stream_events(
 
     except Exception as e:
         print(f"Stream Error (Thread ID: {thread_id}, Set: {set_id}): {e}")
-        traceback.print_exc()
+        # Format and write the traceback off the event loop so other open streams keep flowing
+        await asyncio.to_thread(traceback.print_exception, e)
+        # Deliver text that streamed before the failure
+        if pending_text:
+            yield await prepare_sse_event(
+                "chunk", data_payload=take_pending_chunk(), thread_id=thread_id
+            )
         # --- Yield error and end events using helper ---
         error_msg = f"Streaming error: {str(e)}"
         error_data_payload = SSEErrorData(
@@ -323,6 +400,10 @@ async def stream_events(
         )  # Removed node, set_id args
         yield final_end_event
         # --- End error/end events ---
+    finally:
+        # The client went away (or the run failed) while the next event was still being awaited
+        if next_event is not None and not next_event.done():
+            next_event.cancel()
 
 
 # --- Wrapper for Streaming  ---
@@ -1,23 +1,20 @@
 # src/api_routers/threads.py
 
 import traceback
-import json # Added missing import
-import logging
 from typing import List, Optional
 import aiosqlite
-from fastapi import APIRouter, HTTPException, Path as FastApiPath, Depends, Response, status
-from langgraph.checkpoint.base import CheckpointTuple, BaseCheckpointSaver
+from fastapi import APIRouter, HTTPException, Path as FastApiPath, Query, Response, status
+from langgraph.checkpoint.base import CheckpointTuple
+from langgraph.graph.message import add_messages
 
 # Import models (adjust path if necessary, assuming backend_models is accessible)
 from backend_models import (
     HistoryEntry, MessageTypeModel, RunConfig,
     HumanApiMessageModel, AiApiMessageModel, ToolApiMessageModel, SystemApiMessageModel
 )
-# Import Langchain message types for adaptation logic
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, SystemMessage
 # Import StateSnapshot and Any for type hinting
 from langgraph.pregel import StateSnapshot # Try importing from pregel
-from typing import List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 
 # Dependency function to get the checkpointer (will be passed during router inclusion)
 # This is a placeholder; the actual checkpointer comes from the main app instance.
@@ -35,9 +32,87 @@ router = APIRouter(
     tags=["threads"]
 )
 # Add attributes to hold instances passed from the main app
-router.checkpointer_instances = None
+router.checkpointer_instance = None
 router.graph_app_instance = None # Add attribute for graph instance
 
+# --- Per-type message adapters, dispatched on msg.type ---
+# Let Pydantic validation handle missing nodeId loudly if required by the specific model
+def _adapt_human_message(msg: Any, i: int) -> HumanApiMessageModel:
+    return HumanApiMessageModel.model_validate({
+        "type": "human",
+        "content": str(msg.content),
+        "name": getattr(msg, 'name', None),
+        "tool_call_id": None,
+        "additional_kwargs": getattr(msg, 'additional_kwargs', None),
+        "nodeId": 'user' # Explicitly set nodeId for HumanMessages
+    })
+
+
+def _adapt_ai_message(msg: Any, i: int) -> AiApiMessageModel:
+    extracted_content: Optional[str] = None
+    raw_content = msg.content
+    if isinstance(raw_content, list):
+        for part in raw_content:
+            if isinstance(part, dict) and part.get("type") == "text":
+                extracted_content = part.get("text")
+                break
+    elif isinstance(raw_content, str):
+        extracted_content = raw_content
+    else:
+        extracted_content = str(raw_content)
+
+    tool_calls = getattr(msg, 'tool_calls', [])
+    if not isinstance(tool_calls, list): tool_calls = []
+
+    invalid_tool_calls = getattr(msg, 'invalid_tool_calls', [])
+    if not isinstance(invalid_tool_calls, list): invalid_tool_calls = []
+
+    msg_name = getattr(msg, 'name', None)
+    return AiApiMessageModel.model_validate({
+        "type": "ai",
+        "content": extracted_content,
+        "name": msg_name,
+        "tool_call_id": None,
+        "additional_kwargs": getattr(msg, 'additional_kwargs', None),
+        "tool_calls": tool_calls,
+        "invalid_tool_calls": invalid_tool_calls,
+        "nodeId": msg_name # Use msg.name directly as the source
+    })
+
+
+def _adapt_tool_message(msg: Any, i: int) -> ToolApiMessageModel:
+    msg_name = getattr(msg, 'name', None)
+    return ToolApiMessageModel.model_validate({
+        "type": "tool",
+        "content": str(msg.content),
+        "name": msg_name,
+        "tool_call_id": str(getattr(msg, 'tool_call_id', f'missing_id_{i}')),
+        "additional_kwargs": getattr(msg, 'additional_kwargs', None),
+        "is_error": isinstance(msg.content, Exception),
+        "nodeId": msg_name
+    })
+
+
+def _adapt_system_message(msg: Any, i: int) -> SystemApiMessageModel:
+    msg_name = getattr(msg, 'name', None)
+    return SystemApiMessageModel.model_validate({
+        "type": "system",
+        "content": str(msg.content),
+        "name": msg_name,
+        "tool_call_id": None,
+        "additional_kwargs": getattr(msg, 'additional_kwargs', None),
+        "nodeId": msg_name
+    })
+
+
+_MESSAGE_ADAPTERS: Dict[str, Callable[[Any, int], MessageTypeModel]] = {
+    "human": _adapt_human_message,
+    "ai": _adapt_ai_message,
+    "tool": _adapt_tool_message,
+    "system": _adapt_system_message,
+}
+
+
 # --- Helper Function to Adapt StateSnapshot to HistoryEntry ---
 def _adapt_snapshot_to_history_entry(
     state_snapshot: StateSnapshot, default_thread_id: str
@@ -46,11 +121,33 @@ def _adapt_snapshot_to_history_entry(
     if not state_snapshot or not state_snapshot.values or not state_snapshot.config:
         print("Warning: Invalid StateSnapshot received.")
         return None
+    return _adapt_state_to_history_entry(state_snapshot.config, state_snapshot.values, default_thread_id)
+
+
+def _adapt_checkpoint_tuple_to_history_entry(
+    cp_tuple: CheckpointTuple, default_thread_id: str
+) -> Optional[HistoryEntry]:
+    """
+    Converts a raw CheckpointTuple to the HistoryEntry structure, reading messages from its channel values.
+    Message writes still pending on the checkpoint (e.g. from a run that stopped part way through a step)
+    are folded in with the same reducer the graph uses, as graph.aget_state would. Writes to other channels
+    are ignored, since only messages are returned.
+    """
+    values = dict(cp_tuple.checkpoint.get("channel_values") or {})
+    messages = values.get("messages") or []
+    for _task_id, channel, value in cp_tuple.pending_writes or []:
+        if channel == "messages":
+            messages = add_messages(messages, value)
+    values["messages"] = messages
+    if not messages or not cp_tuple.config:
+        return None
+    return _adapt_state_to_history_entry(cp_tuple.config, values, default_thread_id)
 
-    config = state_snapshot.config
-    values = state_snapshot.values
-    metadata = state_snapshot.metadata # Get metadata
 
+def _adapt_state_to_history_entry(
+    config: Dict[str, Any], values: Dict[str, Any], default_thread_id: str
+) -> HistoryEntry:
+    """Builds a HistoryEntry from a checkpoint's config and its state values."""
     # Extract required fields from config
     checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
     if not checkpoint_id:
@@ -76,87 +173,14 @@ def _adapt_snapshot_to_history_entry(
 
     adapted_messages: List[MessageTypeModel] = []
     for i, msg in enumerate(raw_messages):
-        msg_data = {}
-        adapted_msg = None
-        msg_name = getattr(msg, 'name', None)
         msg_type = getattr(msg, 'type', None)
-        node_id = msg_name # Use msg.name directly as the source
-
-        # Explicitly set nodeId for HumanMessages
-        if msg_type == 'human':
-            node_id = 'user'
-
-        # --- Adapt based on type ---
-        # Let Pydantic validation handle missing nodeId loudly if required by the specific model
-        if msg_type == 'human':
-            msg_data = {
-                "type": "human",
-                "content": str(msg.content),
-                "name": msg_name,
-                "tool_call_id": None,
-                "additional_kwargs": getattr(msg, 'additional_kwargs', None),
-                "nodeId": node_id
-            }
-            adapted_msg = HumanApiMessageModel.model_validate(msg_data)
-        elif msg_type == 'ai':
-            extracted_content: Optional[str] = None
-            raw_content = msg.content
-            if isinstance(raw_content, list):
-                for part in raw_content:
-                    if isinstance(part, dict) and part.get("type") == "text":
-                        extracted_content = part.get("text")
-                        break
-            elif isinstance(raw_content, str):
-                extracted_content = raw_content
-            else:
-                extracted_content = str(raw_content)
-
-            tool_calls = getattr(msg, 'tool_calls', [])
-            if not isinstance(tool_calls, list): tool_calls = []
-
-            invalid_tool_calls = getattr(msg, 'invalid_tool_calls', [])
-            if not isinstance(invalid_tool_calls, list): invalid_tool_calls = []
-
-            msg_data = {
-                "type": "ai",
-                "content": extracted_content,
-                "name": msg_name,
-                "tool_call_id": None,
-                "additional_kwargs": getattr(msg, 'additional_kwargs', None),
-                "tool_calls": tool_calls,
-                "invalid_tool_calls": invalid_tool_calls,
-                "nodeId": node_id
-            }
-            adapted_msg = AiApiMessageModel.model_validate(msg_data)
-        elif msg_type == 'tool':
-             msg_data = {
-                "type": "tool",
-                "content": str(msg.content),
-                "name": msg_name,
-                "tool_call_id": str(getattr(msg, 'tool_call_id', f'missing_id_{i}')),
-                "additional_kwargs": getattr(msg, 'additional_kwargs', None),
-                "is_error": isinstance(msg.content, Exception),
-                "nodeId": node_id
-            }
-             adapted_msg = ToolApiMessageModel.model_validate(msg_data)
-        elif msg_type == 'system':
-             msg_data = {
-                "type": "system",
-                "content": str(msg.content),
-                "name": msg_name,
-                "tool_call_id": None,
-                "additional_kwargs": getattr(msg, 'additional_kwargs', None),
-                "nodeId": node_id
-            }
-             adapted_msg = SystemApiMessageModel.model_validate(msg_data)
-        else:
+        adapter = _MESSAGE_ADAPTERS.get(msg_type)
+        if adapter is None:
              # Handle potential other message types if necessary, or raise error
              print(f"Warning: Unhandled message type '{msg_type}' at index {i} for thread {thread_id}")
              continue # Skip unhandled types for now
-
-        if adapted_msg:
-            adapted_messages.append(adapted_msg)
         # Pydantic validation errors will propagate
+        adapted_messages.append(adapter(msg, i))
 
     return HistoryEntry(
         checkpoint_id=str(checkpoint_id),
@@ -179,30 +203,20 @@ async def get_thread_latest_endpoint(
     try:
         print(f"Fetching latest state snapshot for Thread ID: {thread_id}")
         config = {"configurable": {"thread_id": thread_id}}
-        # Use graph.aget_state to get the StateSnapshot
-        state_snapshot: Optional[StateSnapshot] = await graph_app.aget_state(config)
-
-        if not state_snapshot:
-            # Check if the thread exists at all using the checkpointer
-            checkpointer = router.checkpointer_instance
-            if checkpointer:
-                 cp_tuple = await checkpointer.aget_tuple(config)
-                 if not cp_tuple:
-                      raise HTTPException(status_code=404, detail=f"No history found for thread ID: {thread_id}")
-            # If thread exists but state is None, it's an unexpected issue
-            print(f"Warning: Thread {thread_id} exists but aget_state returned None.")
-            raise HTTPException(status_code=404, detail=f"Could not retrieve latest state for thread ID: {thread_id}")
-
-
-        # Adapt the StateSnapshot using the new helper function
-        history_entry = _adapt_snapshot_to_history_entry(state_snapshot, thread_id)
+        # Read the latest checkpoint straight from the saver; graph.aget_state would also
+        # work out pending tasks for the snapshot, which this endpoint never returns
+        checkpointer = router.checkpointer_instance or graph_app.checkpointer
+        cp_tuple: Optional[CheckpointTuple] = await checkpointer.aget_tuple(config)
+        # Threads unknown to the checkpointer (e.g. after the database was reset) get the
+        # same empty entry as threads without messages, so the frontend shows an empty chat
+        history_entry = _adapt_checkpoint_tuple_to_history_entry(cp_tuple, thread_id) if cp_tuple else None
 
         if not history_entry:
-            # If adaptation returns None, it means the thread exists but has no history yet.
+            # No checkpoint, or a checkpoint without messages: nothing to show yet.
             # Return a default empty HistoryEntry instead of a 500 error.
-            print(f"Thread {thread_id} exists but has no history snapshots. Returning default empty entry.")
+            print(f"Thread {thread_id} has no stored messages. Returning default empty entry.")
             # Attempt to get RunConfig from the potentially minimal snapshot, default if missing
-            run_config_dict = state_snapshot.config.get("configurable", {}).get("runConfig")
+            run_config_dict = cp_tuple.config.get("configurable", {}).get("runConfig") if cp_tuple else None
             try:
                 # Use the RunConfig model directly from backend_models
                 run_config_obj = RunConfig.model_validate(run_config_dict) if run_config_dict else RunConfig(configuredModules=[])
@@ -230,9 +244,10 @@ async def get_thread_latest_endpoint(
 
 @router.get("/{thread_id}/history", response_model=List[HistoryEntry])
 async def get_thread_history_endpoint(
-    thread_id: str = FastApiPath(..., title="The checkpoint thread ID (UUID string)")
+    thread_id: str = FastApiPath(..., title="The checkpoint thread ID (UUID string)"),
+    limit: Optional[int] = Query(None, ge=1, title="Only return the N most recent snapshots")
 ):
-    """Retrieves all history entries (snapshot states) for a specific thread ID."""
+    """Retrieves history entries (snapshot states) for a specific thread ID, optionally only the most recent `limit`."""
     graph_app = router.graph_app_instance # Access passed graph instance
     if not graph_app:
         print("Error: Graph app not available for getting history.")
@@ -244,7 +259,8 @@ async def get_thread_history_endpoint(
         config = {"configurable": {"thread_id": thread_id}}
         snapshot_count = 0
         # Use graph.aget_state_history to iterate through snapshots
-        async for state_snapshot in graph_app.aget_state_history(config):
+        # Each snapshot carries the full message list, so bounding the count bounds the work
+        async for state_snapshot in graph_app.aget_state_history(config, limit=limit):
             snapshot_count += 1
             entry = _adapt_snapshot_to_history_entry(state_snapshot, thread_id)
             if entry:
@@ -1,6 +1,7 @@
 # src/backend_server_async.py
 
 # Standard library imports
+import asyncio
 import os
 import traceback
 from contextlib import asynccontextmanager
@@ -67,7 +68,8 @@ async def lifespan(app: FastAPI):
         print("Waiting for API key to be provided by the frontend...")
 
         # Continue with normal initialization
-        superego_model, inner_model = create_models()
+        # Model construction is blocking; keep it off the event loop
+        superego_model, inner_model = await asyncio.to_thread(create_models)
         graph_app, checkpointer, inner_agent_app = await create_workflow(
             superego_model=superego_model, inner_model=inner_model
         )
@@ -82,25 +84,23 @@ async def lifespan(app: FastAPI):
 
         # Pass instances to routers after they are created
         # This ensures routers have access to the necessary components
+        wired = []
         if graph_app:
             runs_router.router.graph_app_instance = graph_app
             api_key_router.router.graph_app_instance = graph_app
-            print("Passed graph_app instance to runs_router and api_key_router.")
+            threads_router.router.graph_app_instance = graph_app
+            wired.append("graph_app -> runs, threads, api_key")
         if checkpointer:
             runs_router.router.checkpointer_instance = checkpointer
             threads_router.router.checkpointer_instance = checkpointer
             api_key_router.router.checkpointer_instance = checkpointer
-            print(
-                "Passed checkpointer instance to runs_router, threads_router, and api_key_router."
-            )
-        # Pass graph_app instance to threads_router as well
-        if graph_app:
-            threads_router.router.graph_app_instance = graph_app
-            print("Passed graph_app instance to threads_router.")
-        # Pass inner_agent_app instance to api_key_router
+            wired.append("checkpointer -> runs, threads, api_key")
         if inner_agent_app:
             api_key_router.router.inner_agent_app_instance = inner_agent_app
-            print("Passed inner_agent_app instance to api_key_router.")
+            wired.append("inner_agent_app -> api_key")
+        # Report the wiring as one block so startup logs a single write
+        if wired:
+            print("Passed instances to routers:\n  " + "\n  ".join(wired))
 
     except Exception as e:
         print(f"FATAL: Error during startup: {e}")
@@ -1,3 +1,4 @@
+import functools
 import os
 import logging
 from pathlib import Path
@@ -20,6 +21,38 @@ CONSTITUTIONS_DIR.mkdir(parents=True, exist_ok=True)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Parsed constitution bodies keyed by resolved path, stored with the file's
+# mtime so an edited file is re-read on its next request
+_content_cache: Dict[Path, Tuple[int, str]] = {}
+
+
+def _scan_markdown_files(directory: Path):
+    """
+    Yields (path, mtime_ns) for every .md file below directory, reusing scandir's entry stats.
+    Like Path.rglob, symlinked directories are not descended into, so link loops can't recurse.
+    An unreadable directory or file is logged and skipped rather than failing the whole scan.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _scan_markdown_files(Path(entry.path))
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        yield Path(entry.path), entry.stat().st_mtime_ns
+                except OSError as e:
+                    logger.error(f"Error reading constitution entry {entry.path}: {e}")
+    except OSError as e:
+        logger.error(f"Error scanning constitutions directory {directory}: {e}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_constitution_metadata(md_path: Path, mtime_ns: int) -> Tuple[str, Optional[str]]:
+    """(title, description) from a constitution's frontmatter; keyed on mtime so edits are picked up."""
+    post = frontmatter.load(md_path)
+    title = post.metadata.get('title', md_path.name.replace('.md', '').replace('_', ' ').title())
+    return title, post.metadata.get('description')
+
 
 def get_constitution_hierarchy() -> ConstitutionHierarchy:
     """
@@ -33,17 +66,15 @@ def get_constitution_hierarchy() -> ConstitutionHierarchy:
     root_constitutions: List[RemoteConstitutionMetadata] = []
     folder_map: Dict[str, ConstitutionFolder] = {} # Map relative_path -> folder object
 
-    for md_path in CONSTITUTIONS_DIR.rglob("*.md"):
+    for md_path, mtime_ns in _scan_markdown_files(CONSTITUTIONS_DIR):
         try:
             # Calculate relative path (use forward slashes)
             relative_path_obj = md_path.relative_to(CONSTITUTIONS_DIR)
             relative_path_str = relative_path_obj.as_posix()
             filename = md_path.name
 
-            # Parse frontmatter
-            post = frontmatter.load(md_path)
-            title = post.metadata.get('title', filename.replace('.md', '').replace('_', ' ').title())
-            description = post.metadata.get('description')
+            # Parse frontmatter (only for files changed since the last scan)
+            title, description = _read_constitution_metadata(md_path, mtime_ns)
 
             metadata = RemoteConstitutionMetadata(
                 title=title,
@@ -113,6 +144,63 @@ def get_constitution_hierarchy() -> ConstitutionHierarchy:
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _normalize_relative_path(relativePath: str) -> Tuple[bool, str]:
+    """
+    Purely syntactic part of path validation: (is_valid, normalized path).
+    Cached, as the frontend requests the same handful of paths on every run;
+    it never touches the filesystem, so it cannot go stale.
+    """
+    # Basic validation for path components
+    if not relativePath or \
+       any(part in ('', '.', '..') for part in Path(relativePath).parts) or \
+       os.path.isabs(relativePath):
+        return False, relativePath
+
+    # Normalizing ensures consistent path separators and removes redundant parts like './'
+    # but doesn't resolve symlinks or '..' components fully like resolve()
+    # We rely on the initial check and the final check after resolving
+    normalized_rel_path = os.path.normpath(relativePath)
+    # Re-check after normalization
+    if any(part in ('', '.', '..') for part in Path(normalized_rel_path).parts) or \
+       os.path.isabs(normalized_rel_path):
+        return False, normalized_rel_path
+    return True, normalized_rel_path
+
+
+def _resolve_constitution_path(relativePath: str) -> Optional[Path]:
+    """
+    Validates a relative constitution path and resolves it inside CONSTITUTIONS_DIR.
+    Resolution and the containment check run on every call, so retargeted symlinks
+    are caught and every rejected request is logged.
+
+    Returns:
+        Optional[Path]: The resolved path, or None if the path is malformed or
+                        escapes CONSTITUTIONS_DIR.
+    """
+    is_valid, normalized_rel_path = _normalize_relative_path(relativePath)
+    if not is_valid:
+        logger.warning(f"Invalid relative path format requested: {relativePath} (normalized: {normalized_rel_path})")
+        return None
+
+    # Construct the full path relative to CONSTITUTIONS_DIR
+    full_path = (CONSTITUTIONS_DIR / normalized_rel_path).resolve()
+
+    # --- Security Check ---
+    # Ensure the resolved path is still within the CONSTITUTIONS_DIR or is CONSTITUTIONS_DIR itself
+    # Using os.path.commonpath is a robust way to check containment
+    common_path = os.path.commonpath([str(CONSTITUTIONS_DIR), str(full_path)])
+    if common_path != str(CONSTITUTIONS_DIR):
+        logger.warning(
+            f"Security Alert: Attempted path traversal detected. "
+            f"Requested relativePath '{relativePath}' resolved to '{full_path}', "
+            f"which is outside the allowed directory '{CONSTITUTIONS_DIR}'."
+        )
+        return None
+
+    return full_path
+
+
 def get_constitution_content(relativePath: str) -> Optional[str]:
     """
     Reads the main content (after YAML frontmatter) of a single constitution
@@ -125,38 +213,10 @@ def get_constitution_content(relativePath: str) -> Optional[str]:
         Optional[str]: The content of the constitution, or None if not found,
                        access is denied due to security checks, or a parsing error occurs.
     """
-    # Basic validation for path components
-    if not relativePath or \
-       any(part in ('', '.', '..') for part in Path(relativePath).parts) or \
-       os.path.isabs(relativePath):
-        logger.warning(f"Invalid relative path format requested: {relativePath}")
-        return None
-
+    full_path = None
     try:
-        # Construct the full path relative to CONSTITUTIONS_DIR
-        # Normalizing ensures consistent path separators and removes redundant parts like './'
-        # but doesn't resolve symlinks or '..' components fully like resolve()
-        # We rely on the initial check and the final check after resolving
-        normalized_rel_path = os.path.normpath(relativePath)
-        # Re-check after normalization
-        if any(part in ('', '.', '..') for part in Path(normalized_rel_path).parts) or \
-           os.path.isabs(normalized_rel_path):
-             logger.warning(f"Invalid relative path format after normalization: {normalized_rel_path} (from {relativePath})")
-             return None
-
-        full_path = (CONSTITUTIONS_DIR / normalized_rel_path).resolve()
-
-
-        # --- Security Check ---
-        # Ensure the resolved path is still within the CONSTITUTIONS_DIR or is CONSTITUTIONS_DIR itself
-        # Using os.path.commonpath is a robust way to check containment
-        common_path = os.path.commonpath([str(CONSTITUTIONS_DIR), str(full_path)])
-        if common_path != str(CONSTITUTIONS_DIR):
-            logger.warning(
-                f"Security Alert: Attempted path traversal detected. "
-                f"Requested relativePath '{relativePath}' resolved to '{full_path}', "
-                f"which is outside the allowed directory '{CONSTITUTIONS_DIR}'."
-            )
+        full_path = _resolve_constitution_path(relativePath)
+        if full_path is None:
             return None
 
         if not full_path.is_file():
@@ -164,8 +224,14 @@ def get_constitution_content(relativePath: str) -> Optional[str]:
             logger.warning(f"Constitution file not found at resolved path: {full_path} (from relative: {relativePath})")
             return None
 
+        mtime_ns = full_path.stat().st_mtime_ns
+        cached = _content_cache.get(full_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
         # Load content using frontmatter
         post = frontmatter.load(full_path)
+        _content_cache[full_path] = (mtime_ns, post.content)
         return post.content
 
     except FileNotFoundError:
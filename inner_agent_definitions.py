@@ -1,33 +1,33 @@
-import os
+import functools
 from typing import Dict, List, Any
 from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langgraph.graph import MessagesState
-from langchain_anthropic import ChatAnthropic
 from config import CONFIG
-from utils import shout_if_fails 
+from utils import read_text_file_cached, shout_if_fails
+
+@functools.lru_cache(maxsize=8)
+def _build_inner_agent_prompt(inner_agent_instructions: str) -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", inner_agent_instructions),
+        MessagesPlaceholder(variable_name="messages")
+    ])
 
 @shout_if_fails
-def load_inner_agent_instructions():
+def get_inner_agent_prompt() -> ChatPromptTemplate:
+    """Returns the inner agent prompt, rebuilt only when the instructions file changes."""
     file_path = CONFIG["file_paths"]["inner_agent_instructions"]
-    with open(file_path, encoding='utf-8') as f:
-        return f.read()
+    return _build_inner_agent_prompt(read_text_file_cached(file_path))
 
 def create_default_inner_agent_runnable(inner_model: Any):
     """Creates the default runnable chain for the inner agent."""
-    inner_agent_instructions = load_inner_agent_instructions()
-    prompt_template = ChatPromptTemplate.from_messages([
-        ("system", inner_agent_instructions),
-        MessagesPlaceholder(variable_name="messages")
-    ])
-    chain = prompt_template | inner_model
+    chain = get_inner_agent_prompt() | inner_model
     return chain
 
 # This is the function to be used as the node in the graph
 def default_inner_agent_node(state: MessagesState, inner_model: Any) -> Dict[str, List[BaseMessage]]:
     """Executes the default inner agent logic."""
     messages = state["messages"]
-    # Create the runnable each time or pass it if it's stable
     chain = create_default_inner_agent_runnable(inner_model)
     response = chain.invoke({"messages": messages})
     # Ensure the response has a name for downstream processing (like history adaptation)
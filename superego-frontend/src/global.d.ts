@@ -217,6 +217,16 @@ declare global {
         email_sent: boolean;
     }
 
+    // --- UI Helper Types ---
+    /** Resumable bracket/string scan over streamed tool-call args, which only ever grow by appends */
+    interface JsonScanState {
+        scannedLength: number; // Characters of the args already scanned
+        depth: number;
+        inString: boolean;
+        escaped: boolean;
+        hasContent: boolean; // Seen any non-whitespace character yet
+    }
+
 
 
 }
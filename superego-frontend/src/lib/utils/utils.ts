@@ -51,3 +51,40 @@ export function deepClone<T>(obj: T): T {
     throw new Error("Cloning failed");
   }
 }
+
+
+/**
+ * Checks whether a streamed JSON text has closed all of its objects, arrays and strings.
+ * Lets callers skip JSON.parse (and its exception) while tool-call args are still arriving chunk by chunk.
+ * Streamed args only grow by appends (see handleToolChunk in sse.svelte.ts), so given the state from the
+ * previous call only the characters past `previous.scannedLength` are scanned; a shorter text restarts the scan.
+ * @param text The JSON text received so far.
+ * @param previous The scan state returned for an earlier, prefix version of the text, if any.
+ * @returns The completeness result and the state to pass in with the next version of the text.
+ */
+export function scanJsonCompleteness(text: string, previous?: JsonScanState): { complete: boolean; state: JsonScanState } {
+    const resumable = previous !== undefined && text.length >= previous.scannedLength;
+    let depth = resumable ? previous.depth : 0;
+    let inString = resumable ? previous.inString : false;
+    let escaped = resumable ? previous.escaped : false;
+    let hasContent = resumable ? previous.hasContent : false;
+    for (let i = resumable ? previous.scannedLength : 0; i < text.length; i++) {
+        const ch = text[i];
+        if (!hasContent && ch.trim() !== '') hasContent = true;
+        if (inString) {
+            if (escaped) escaped = false;
+            else if (ch === '\\') escaped = true;
+            else if (ch === '"') inString = false;
+        } else if (ch === '"') {
+            inString = true;
+        } else if (ch === '{' || ch === '[') {
+            depth++;
+        } else if (ch === '}' || ch === ']') {
+            depth--;
+        }
+    }
+    return {
+        complete: depth === 0 && !inString && hasContent,
+        state: { scannedLength: text.length, depth, inString, escaped, hasContent }
+    };
+}
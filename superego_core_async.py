@@ -15,7 +15,7 @@ from langgraph.prebuilt import ToolNode
 from config import CONFIG
 from inner_agent_definitions import default_inner_agent_node
 from keystore import keystore
-from utils import shout_if_fails
+from utils import read_text_file_cached, shout_if_fails
 
 # The API key will be retrieved from the keystore based on session ID
 
@@ -23,8 +23,13 @@ from utils import shout_if_fails
 @shout_if_fails
 def load_superego_instructions():
     file_path = CONFIG["file_paths"]["superego_instructions"]
-    with open(file_path, encoding="utf-8") as f:
-        return f.read()
+    return read_text_file_cached(file_path)
+
+
+SUPEREGO_ALLOWED_TEXT = "✅ Superego allowed the prompt."
+SUPEREGO_BLOCKED_TEXT = "❌ Superego blocked the prompt."
+
+CHECKPOINT_MMAP_SIZE = 256 * 1024 * 1024  # bytes of conversations.db mapped into memory
 
 
 @tool
@@ -35,11 +40,7 @@ def superego_decision(allow: bool, message: str = "") -> str:
         allow: Boolean indicating whether to allow the input
         message: Optional message explaining the decision
     """
-    text = (
-        "✅ Superego allowed the prompt."
-        if allow
-        else "❌ Superego blocked the prompt."
-    )
+    text = SUPEREGO_ALLOWED_TEXT if allow else SUPEREGO_BLOCKED_TEXT
     text += f"\n\n{message}" if message else ""
     return text
 
@@ -81,8 +82,10 @@ def should_continue_from_tools(
 
     if last_message.name == "superego_decision":
         try:
-            # Check if the content starts with "Superego allowed the prompt"
-            allow_decision = "Superego allowed the prompt" in str(last_message.content)
+            # The verdict line always leads the tool output, so an anchored check suffices
+            allow_decision = str(last_message.content).startswith(
+                SUPEREGO_ALLOWED_TEXT
+            )
             return "inner_agent" if allow_decision else END
         except Exception:
             print(
@@ -208,6 +211,10 @@ async def create_workflow(
 
     # Use aiosqlite instead of sqlite3
     conn = await aiosqlite.connect(db_path)
+    # Serve checkpoint reads from a memory-mapped file so history and state
+    # lookups rarely leave the page cache (WAL mode is set by the saver's setup)
+    async with conn.execute(f"PRAGMA mmap_size={CHECKPOINT_MMAP_SIZE}"):
+        pass
     # Use AsyncSqliteSaver instead of SqliteSaver
     checkpointer = AsyncSqliteSaver(conn=conn)
 
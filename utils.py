@@ -1,4 +1,5 @@
 import functools
+import os
 import sys
 import traceback
 from typing import Callable, Any
@@ -6,11 +7,14 @@ import json
 from typing import Literal, Optional, Any
 from sse_starlette.sse import ServerSentEvent
 from pydantic import ValidationError
-from backend_models import SSEEventData, SSERunStartData, SSEToolCallChunkData, SSEToolResultData, SSEEndData
+from backend_models import SSEEventData
 
 # Define the full Literal type for SSE events here for the helper function
 SSEEventType = Literal["run_start", "chunk", "ai_tool_chunk", "tool_result", "error", "end"]
 
+# Per-event success logging runs once per streamed token; only enable it when debugging
+SSE_DEBUG = os.getenv("SUPEREGO_DEBUG", "false").lower() == "true"
+
 
 
 try:
@@ -40,6 +44,17 @@ def shout_if_fails(func: Callable) -> Callable:
     return wrapper
 
 
+@functools.lru_cache(maxsize=16)
+def _read_text_file(file_path: str, mtime_ns: int) -> str:
+    # mtime_ns is part of the cache key so an edited file is re-read
+    with open(file_path, encoding="utf-8") as f:
+        return f.read()
+
+def read_text_file_cached(file_path: str) -> str:
+    """Returns a UTF-8 file's contents, re-reading it only when its mtime changes."""
+    return _read_text_file(file_path, os.stat(file_path).st_mtime_ns)
+
+
 # --- SSE Event Helper Function ---
 async def prepare_sse_event(
     event_type: SSEEventType,
@@ -50,23 +65,20 @@ async def prepare_sse_event(
     """
     Safely creates a ServerSentEvent payload and object.
     Returns the intended event or a fallback error event if creation fails.
-    Logs success/failure during preparation.
+    Logs failures during preparation, and successes too when SUPEREGO_DEBUG is set.
     """
     log_prefix = f"[SSE Prep - {event_type} - Thread: {thread_id or 'N/A'}]"
     try:
-        # Validate data payload if it's a Pydantic model expected by SSEEventData
-        # This helps catch errors before SSEEventData creation itself
-        if isinstance(data_payload, (SSERunStartData, SSEToolCallChunkData, SSEToolResultData, SSEEndData)):
-             # Re-validate to ensure consistency, though it should be valid if constructed correctly
-             data_payload.model_validate(data_payload.model_dump()) # Or just pass through if already validated
-
+        # Payload models are validated when constructed; SSEEventData checks the union below,
+        # so a dump/re-validate round trip per event would only repeat that work
         # Node and set_id are no longer top-level fields in SSEEventData
         sse_data = SSEEventData(
             type=event_type,
             data=data_payload,
             thread_id=thread_id
         )
-        print(f"{log_prefix} Payload prepared successfully.")
+        if SSE_DEBUG:
+            print(f"{log_prefix} Payload prepared successfully.")
         return ServerSentEvent(data=sse_data.model_dump_json())
     except (ValidationError, Exception) as e:
         error_msg = f"Error preparing SSE event payload: {e}"
@@ -77,7 +89,7 @@ async def prepare_sse_event(
         # Create a fallback error event payload
         try:
             # Try to extract node from original payload for fallback error, default otherwise
-            fallback_node = getattr(data_payload, 'node', 'event_preparation') if hasattr(data_payload, 'node') else 'event_preparation'
+            fallback_node = getattr(data_payload, 'node', 'event_preparation')
             # Create fallback error data payload (assuming SSEErrorData model exists)
             # If SSEErrorData doesn't exist or causes issues, revert to simple string
             try: